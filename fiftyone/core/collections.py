@@ -595,12 +595,16 @@ class SampleCollection(object):
             self, dataset_exporter=dataset_exporter, label_field=label_field
         )
 
-    def aggregate(self, pipeline=None):
+    def aggregate(self, pipeline=None, batch_size=None, hint=None):
         """Calls the collection's current MongoDB aggregation pipeline.
 
         Args:
             pipeline (None): an optional aggregation pipeline (list of dicts)
                 to append to the collections's pipeline before calling it
+            batch_size (None): an optional number of documents to return per
+                batch of the aggregation cursor
+            hint (None): an optional index name or specification to use for
+                the aggregation
 
         Returns:
             an iterable over the aggregation result
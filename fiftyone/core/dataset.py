@@ -173,6 +173,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         else:
             self._doc, self._sample_doc_cls = _load_dataset(name)
 
+        self._sample_collection_conn = None
         self._deleted = False
 
     def __len__(self):
@@ -1274,12 +1275,16 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         dataset.add_images_patt(image_patt, tags=tags)
         return dataset
 
-    def aggregate(self, pipeline=None):
+    def aggregate(self, pipeline=None, batch_size=None, hint=None):
         """Calls the current MongoDB aggregation pipeline on the dataset.
 
         Args:
             pipeline (None): an optional aggregation pipeline (list of dicts)
                 to aggregate on
+            batch_size (None): an optional number of documents to return per
+                batch of the aggregation cursor
+            hint (None): an optional index name or specification to use for
+                the aggregation
 
         Returns:
             an iterable over the aggregation result
@@ -1287,7 +1292,14 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if pipeline is None:
             pipeline = []
 
-        return self._sample_collection.aggregate(pipeline)
+        kwargs = {}
+        if batch_size is not None:
+            kwargs["batchSize"] = batch_size
+
+        if hint is not None:
+            kwargs["hint"] = hint
+
+        return self._sample_collection.aggregate(pipeline, **kwargs)
 
     def serialize(self):
         """Serializes the dataset.
@@ -1381,7 +1393,12 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
     @property
     def _sample_collection(self):
-        return foo.get_db_conn()[self._sample_collection_name]
+        if self._sample_collection_conn is None:
+            self._sample_collection_conn = foo.get_db_conn()[
+                self._sample_collection_name
+            ]
+
+        return self._sample_collection_conn
 
     def _apply_field_schema(self, new_fields):
         curr_fields = self.get_field_schema()
@@ -96,8 +96,8 @@ class ViewStageError(Exception):
     pass
 
 
-class Exclude(ViewStage):
-    """Excludes the samples with the given IDs from the view.
+class _SampleIDsStage(ViewStage):
+    """Base class for stages that select or exclude samples by their IDs.
 
     Args:
         sample_ids: a sample ID or iterable of sample IDs
@@ -109,8 +109,36 @@ class Exclude(ViewStage):
         else:
             self._sample_ids = list(sample_ids)
 
+        self._object_ids = None
         self._validate()
 
+    def _kwargs(self):
+        return [["sample_ids", self._sample_ids]]
+
+    @classmethod
+    def _params(cls):
+        return [{"name": "sample_ids", "type": "list<id>|id"}]
+
+    def _get_object_ids(self):
+        # The conversion is cached so that it is only performed once, even
+        # though the stage is compiled every time its view is aggregated
+        if self._object_ids is None:
+            self._object_ids = list(map(ObjectId, self._sample_ids))
+
+        return self._object_ids
+
+    def _validate(self):
+        # Ensures that ObjectIDs are valid
+        self._get_object_ids()
+
+
+class Exclude(_SampleIDsStage):
+    """Excludes the samples with the given IDs from the view.
+
+    Args:
+        sample_ids: a sample ID or iterable of sample IDs
+    """
+
     @property
     def sample_ids(self):
         """The list of sample IDs to exclude."""
@@ -122,20 +150,9 @@ class Exclude(ViewStage):
         Returns:
             a MongoDB aggregation pipeline (list of dicts)
         """
-        sample_ids = [ObjectId(id) for id in self._sample_ids]
+        sample_ids = self._get_object_ids()
         return Match({"_id": {"$not": {"$in": sample_ids}}}).to_mongo()
 
-    def _kwargs(self):
-        return [["sample_ids", self._sample_ids]]
-
-    @classmethod
-    def _params(cls):
-        return [{"name": "sample_ids", "type": "list<id>|id"}]
-
-    def _validate(self):
-        # Ensures that ObjectIDs are valid
-        self.to_mongo()
-
 
 class ExcludeFields(ViewStage):
     """Excludes the fields with the given names from the samples in the view.
@@ -507,21 +524,13 @@ class Mongo(ViewStage):
         return [{"name": "pipeline", "type": "dict"}]
 
 
-class Select(ViewStage):
+class Select(_SampleIDsStage):
     """Selects the samples with the given IDs from the view.
 
     Args:
         sample_ids: a sample ID or iterable of sample IDs
     """
 
-    def __init__(self, sample_ids):
-        if etau.is_str(sample_ids):
-            self._sample_ids = [sample_ids]
-        else:
-            self._sample_ids = list(sample_ids)
-
-        self._validate()
-
     @property
     def sample_ids(self):
         """The list of sample IDs to select."""
@@ -533,20 +542,9 @@ class Select(ViewStage):
         Returns:
             a MongoDB aggregation pipeline (list of dicts)
         """
-        sample_ids = [ObjectId(id) for id in self._sample_ids]
+        sample_ids = self._get_object_ids()
         return Match({"_id": {"$in": sample_ids}}).to_mongo()
 
-    def _kwargs(self):
-        return [["sample_ids", self._sample_ids]]
-
-    @classmethod
-    def _params(cls):
-        return [{"name": "sample_ids", "type": "list<id>|id"}]
-
-    def _validate(self):
-        # Ensures that ObjectIDs are valid
-        self.to_mongo()
-
 
 class SelectFields(ViewStage):
     """Selects *only* the fields with the given names from the samples in the
@@ -84,10 +84,10 @@ class StateDescription(etas.Serializable):
         if dataset is not None:
             view = fov.DatasetView(dataset)
             if view_ is not None:
-                view._stages = [
+                view._stages = tuple(
                     fos.ViewStage._from_dict(s)
                     for s in json_util.loads(view_["view"])
-                ]
+                )
 
         selected = d.get("selected", [])
 
@@ -6,10 +6,12 @@ Dataset views.
 |
 """
 from collections import OrderedDict
-from copy import copy, deepcopy
 import numbers
 
 from bson import ObjectId, json_util
+from bson.errors import InvalidId
+
+import eta.core.utils as etau
 
 import fiftyone.core.collections as foc
 import fiftyone.core.sample as fos
@@ -49,9 +51,17 @@ class DatasetView(foc.SampleCollection):
         dataset: a :class:`fiftyone.core.dataset.Dataset`
     """
 
+    # Batch size used when iterating over samples from the database
+    _BATCH_SIZE = 512
+
+    # Indexes to use when a pipeline starts by matching only on these fields
+    _DEFAULT_HINTS = {"_id": "_id_"}
+
     def __init__(self, dataset):
         self._dataset = dataset
-        self._stages = []
+        self._stages = ()
+        self._selected_excluded_fields = None
+        self._filtered_fields = None
 
     def __len__(self):
         try:
@@ -72,16 +82,40 @@ class DatasetView(foc.SampleCollection):
         if isinstance(sample_id, slice):
             return self._slice(sample_id)
 
-        view = self.match({"_id": ObjectId(sample_id)})
-        try:
-            return view.first()
-        except ValueError:
+        if not self._stages:
+            # The view contains all samples in the dataset, so the sample can
+            # be loaded directly rather than via an aggregation
+            d = self._dataset._sample_collection.find_one(
+                {"_id": ObjectId(sample_id)}
+            )
+            if d is None:
+                raise KeyError("No sample found with ID '%s'" % sample_id)
+
+            return self._make_sample_view(d)
+
+        view = self.match({"_id": ObjectId(sample_id)}).limit(1)
+        sample = next(iter(view), None)
+        if sample is None:
             raise KeyError("No sample found with ID '%s'" % sample_id)
 
+        return sample
+
+    def __contains__(self, sample_id):
+        try:
+            _id = ObjectId(sample_id)
+        except (TypeError, InvalidId):
+            return False
+
+        # Only the ID is projected, since we just need to check existence
+        pipeline = [
+            {"$match": {"_id": _id}},
+            {"$limit": 1},
+            {"$project": {"_id": True}},
+        ]
+        return next(self.aggregate(pipeline), None) is not None
+
     def __copy__(self):
-        view = self.__class__(self._dataset)
-        view._stages = deepcopy(self._stages)
-        return view
+        return self._with_stages(self._stages)
 
     @property
     def name(self):
@@ -105,14 +139,27 @@ class DatasetView(foc.SampleCollection):
         """The list of :class:`fiftyone.core.stages.ViewStage` instances in
         this view's pipeline.
         """
-        return self._stages
+        return list(self._stages)
 
-    def summary(self):
+    def summary(self, exact_count=False):
         """Returns a string summary of the view.
 
+        Args:
+            exact_count (False): whether to always count the samples in the
+                view. By default, views with no stages report the estimated
+                number of samples in the dataset, which does not require
+                scanning the collection
+
         Returns:
             a string summary
         """
+        if exact_count or self._stages:
+            num_samples, tags = self._get_count_and_tags()
+        else:
+            sample_collection = self._dataset._sample_collection
+            num_samples = sample_collection.estimated_document_count()
+            tags = self.get_tags()
+
         field_schema = self.get_field_schema()
         fields_str = self._dataset._to_fields_str(field_schema)
 
@@ -129,8 +176,8 @@ class DatasetView(foc.SampleCollection):
         return "\n".join(
             [
                 "Dataset:        %s" % self.dataset_name,
-                "Num samples:    %d" % len(self),
-                "Tags:           %s" % self.get_tags(),
+                "Num samples:    %d" % num_samples,
+                "Tags:           %s" % tags,
                 "Sample fields:",
                 fields_str,
                 "Pipeline stages:",
@@ -147,12 +194,17 @@ class DatasetView(foc.SampleCollection):
         selected_fields, excluded_fields = self._get_selected_excluded_fields()
         filtered_fields = self._get_filtered_fields()
 
-        for d in self.aggregate():
+        # Attribute lookups are hoisted out of the loop, since they are
+        # relatively expensive on datasets (see `Dataset.__getattribute__`)
+        dataset = self._dataset
+        sample_dict_to_doc = dataset._sample_dict_to_doc
+
+        for d in self.aggregate(batch_size=self._BATCH_SIZE):
             try:
-                doc = self._dataset._sample_dict_to_doc(d)
+                doc = sample_dict_to_doc(d)
                 yield fos.SampleView(
                     doc,
-                    self._dataset,
+                    dataset,
                     selected_fields=selected_fields,
                     excluded_fields=excluded_fields,
                     filtered_fields=filtered_fields,
@@ -215,13 +267,8 @@ class DatasetView(foc.SampleCollection):
         Returns:
             a list of tags
         """
-        pipeline = [
-            {"$project": {"tags": "$tags"}},
-            {"$unwind": "$tags"},
-            {"$group": {"_id": "None", "all_tags": {"$addToSet": "$tags"}}},
-        ]
         try:
-            return next(self.aggregate(pipeline))["all_tags"]
+            return next(self.aggregate(_make_tags_pipeline()))["all_tags"]
         except StopIteration:
             pass
 
@@ -236,12 +283,18 @@ class DatasetView(foc.SampleCollection):
         """
         return self._add_view_stage(stage)
 
-    def aggregate(self, pipeline=None):
+    def aggregate(self, pipeline=None, batch_size=None, hint=None):
         """Calls the view's current MongoDB aggregation pipeline.
 
         Args:
             pipeline (None): an optional aggregation pipeline (list of dicts)
                 to append to the view's pipeline before calling it
+            batch_size (None): an optional number of documents to return per
+                batch of the aggregation cursor
+            hint (None): an optional index name or specification to use for
+                the aggregation. By default, an index from
+                ``DatasetView._DEFAULT_HINTS`` is used when the pipeline
+                starts with an equality match on its field
 
         Returns:
             an iterable over the aggregation result
@@ -253,7 +306,14 @@ class DatasetView(foc.SampleCollection):
         if pipeline is not None:
             _pipeline.extend(pipeline)
 
-        return self._dataset.aggregate(_pipeline)
+        _pipeline = _fuse_stages(_push_down_matches(_pipeline))
+
+        if hint is None:
+            hint = _get_default_hint(_pipeline, self._DEFAULT_HINTS)
+
+        return self._dataset.aggregate(
+            _pipeline, batch_size=batch_size, hint=hint
+        )
 
     def to_dict(self, rel_dir=None):
         """Returns a JSON dictionary representation of the view.
@@ -323,46 +383,280 @@ class DatasetView(foc.SampleCollection):
         return self.skip(start).limit(stop - start)
 
     def _add_view_stage(self, stage):
-        view = copy(self)
-        view._stages.append(stage)
+        return self._with_stages(self._stages + (stage,))
+
+    def _with_stages(self, stages):
+        # View stages are never modified after construction, so the tuple of
+        # stages can be shared between views
+        view = self.__class__(self._dataset)
+        view._stages = stages
         return view
 
+    def _make_sample_view(self, d):
+        doc = self._dataset._sample_dict_to_doc(d)
+        return fos.SampleView(doc, self._dataset)
+
+    def _get_count_and_tags(self):
+        """Computes the number of samples and the unique tags of the view in
+        a single aggregation.
+
+        Returns:
+            a tuple of
+
+            -   count: the number of samples in the view
+            -   tags: the list of unique tags of samples in the view
+        """
+        pipeline = [
+            {
+                "$facet": {
+                    "count": [{"$count": "count"}],
+                    "tags": _make_tags_pipeline(),
+                }
+            }
+        ]
+        result = next(self.aggregate(pipeline))
+
+        count = result["count"][0]["count"] if result["count"] else 0
+        tags = result["tags"][0]["all_tags"] if result["tags"] else []
+
+        return count, tags
+
     def _get_selected_excluded_fields(self):
         """Checks all stages to find the selected and excluded fields.
 
         Returns:
             a tuple of
 
-            -   selected_fields: the set of selected fields
-            -   excluded_fields: the set of excluded_fields
+            -   selected_fields: the frozenset of selected fields
+            -   excluded_fields: the frozenset of excluded_fields
 
             One of these will always be ``None``, meaning nothing is
             selected/excluded
         """
-        selected_fields = None
-        excluded_fields = set()
+        if self._selected_excluded_fields is None:
+            selected_fields = None
+            excluded_fields = set()
+
+            for stage in self._stages:
+                if isinstance(stage, fost.SelectFields):
+                    if selected_fields is None:
+                        selected_fields = set(stage.field_names)
+                    else:
+                        selected_fields.intersection_update(stage.field_names)
+
+                if isinstance(stage, fost.ExcludeFields):
+                    excluded_fields.update(stage.field_names)
+
+            if selected_fields is not None:
+                selected_fields = frozenset(
+                    selected_fields.difference(excluded_fields)
+                )
+                excluded_fields = None
+            else:
+                excluded_fields = frozenset(excluded_fields)
 
-        for stage in self._stages:
-            if isinstance(stage, fost.SelectFields):
-                if selected_fields is None:
-                    selected_fields = set(stage.field_names)
-                else:
-                    selected_fields.intersection_update(stage.field_names)
+            self._selected_excluded_fields = selected_fields, excluded_fields
 
-            if isinstance(stage, fost.ExcludeFields):
-                excluded_fields.update(stage.field_names)
+        return self._selected_excluded_fields
 
-        if selected_fields is not None:
-            selected_fields.difference_update(excluded_fields)
-            excluded_fields = None
+    def _get_filtered_fields(self):
+        if self._filtered_fields is None:
+            filtered_fields = set()
+            for stage in self._stages:
+                if isinstance(stage, fost._FilterList):
+                    filtered_fields.add(stage.list_field)
+
+            self._filtered_fields = frozenset(filtered_fields)
+
+        return self._filtered_fields
+
+
+def _make_tags_pipeline():
+    # Collects the distinct tag lists and unions them, which avoids generating
+    # a document per tag via `$unwind`
+    return [
+        {
+            "$group": {
+                "_id": None,
+                "all_tags": {"$addToSet": {"$ifNull": ["$tags", []]}},
+            }
+        },
+        {
+            "$project": {
+                "all_tags": {
+                    "$reduce": {
+                        "input": "$all_tags",
+                        "initialValue": [],
+                        "in": {"$setUnion": ["$$value", "$$this"]},
+                    }
+                }
+            }
+        },
+    ]
 
-        return selected_fields, excluded_fields
 
-    def _get_filtered_fields(self):
-        filtered_fields = set()
+def _get_default_hint(pipeline, hints):
+    """Returns the index hint to use for the given MongoDB aggregation
+    pipeline, if it starts with a ``$match`` that only performs equality or
+    ``$in`` matching on a field in ``hints``.
+
+    Args:
+        pipeline: a MongoDB aggregation pipeline (list of dicts)
+        hints: a dict mapping field names to index names
+
+    Returns:
+        an index name, or ``None``
+    """
+    if not pipeline or "$match" not in pipeline[0]:
+        return None
+
+    match = pipeline[0]["$match"]
+    if len(match) != 1:
+        return None
+
+    field, value = next(iter(match.items()))
+    if field not in hints:
+        return None
+
+    if isinstance(value, dict) and not set(value.keys()) <= {"$eq", "$in"}:
+        return None
+
+    return hints[field]
+
+
+def _push_down_matches(pipeline):
+    """Moves ``$match`` stages of the given MongoDB aggregation pipeline
+    towards the start of the pipeline, when doing so does not change the
+    result of the pipeline.
 
-        for stage in self._stages:
-            if isinstance(stage, fost._FilterList):
-                filtered_fields.add(stage.list_field)
+    A ``$match`` stage is swapped with a preceding ``$sort`` stage, and with a
+    preceding ``$project``, ``$addFields``, ``$set``, or ``$unset`` stage that
+    does not modify any of the fields that the ``$match`` references. Matches
+    are never moved past ``$skip`` or ``$limit`` stages, since that would
+    change which samples are returned.
+
+    Args:
+        pipeline: a MongoDB aggregation pipeline (list of dicts)
+
+    Returns:
+        a new MongoDB aggregation pipeline (list of dicts)
+    """
+    pipeline = list(pipeline)
+
+    swapped = True
+    while swapped:
+        swapped = False
+        for idx in range(1, len(pipeline)):
+            stage = pipeline[idx]
+            prev = pipeline[idx - 1]
+            if "$match" not in stage or "$match" in prev:
+                continue
+
+            fields = _get_match_fields(stage["$match"])
+            if _can_swap_match(prev, fields):
+                pipeline[idx - 1] = stage
+                pipeline[idx] = prev
+                swapped = True
+
+    return pipeline
+
+
+def _can_swap_match(stage, fields):
+    if len(stage) != 1:
+        return False
+
+    if "$sort" in stage:
+        return True
+
+    # Match references unknown fields
+    if fields is None:
+        return False
+
+    if "$project" in stage:
+        # Only pure inclusion projections of the referenced fields are safe
+        project = stage["$project"]
+        for field in fields:
+            value = project.get(field, field == "_id")
+            if value is not True and value != 1:
+                return False
+
+        return True
+
+    if "$addFields" in stage or "$set" in stage:
+        modified = stage.get("$addFields", stage.get("$set"))
+    elif "$unset" in stage:
+        modified = stage["$unset"]
+        if etau.is_str(modified):
+            modified = [modified]
+    else:
+        return False
+
+    modified_roots = {_get_root_field(f) for f in modified}
+    return not modified_roots & fields
+
+
+def _get_match_fields(match):
+    """Returns the set of root fields referenced by the given ``$match``
+    filter, or ``None`` if the referenced fields cannot be determined.
+    """
+    fields = set()
+    for key, value in match.items():
+        if key in ("$and", "$or", "$nor"):
+            for condition in value:
+                _fields = _get_match_fields(condition)
+                if _fields is None:
+                    return None
+
+                fields.update(_fields)
+        elif key.startswith("$"):
+            return None
+        else:
+            fields.add(_get_root_field(key))
+
+    return fields
+
+
+def _get_root_field(field):
+    return field.split(".", 1)[0]
+
+
+def _fuse_stages(pipeline):
+    """Fuses adjacent stages of the same type in the given MongoDB aggregation
+    pipeline, when doing so does not change the result of the pipeline.
+
+    The following fusions are performed:
+
+    -   consecutive ``$match`` stages are combined into a single ``$match``
+        whose conditions are joined via ``$and``
+    -   consecutive ``$skip`` stages are combined by summing their values
+    -   consecutive ``$limit`` stages are combined by taking their minimum
+
+    Args:
+        pipeline: a MongoDB aggregation pipeline (list of dicts)
+
+    Returns:
+        a new MongoDB aggregation pipeline (list of dicts)
+    """
+    fused = []
+    for stage in pipeline:
+        prev = fused[-1] if fused else None
+        if prev is None or len(stage) != 1 or prev.keys() != stage.keys():
+            fused.append(stage)
+            continue
+
+        if "$match" in stage:
+            prev_match = prev["$match"]
+            if set(prev_match.keys()) == {"$and"}:
+                conditions = prev_match["$and"] + [stage["$match"]]
+            else:
+                conditions = [prev_match, stage["$match"]]
+
+            fused[-1] = {"$match": {"$and": conditions}}
+        elif "$skip" in stage:
+            fused[-1] = {"$skip": prev["$skip"] + stage["$skip"]}
+        elif "$limit" in stage:
+            fused[-1] = {"$limit": min(prev["$limit"], stage["$limit"])}
+        else:
+            fused.append(stage)
 
-        return filtered_fields
+    return fused
@@ -255,13 +255,16 @@ def _get_distributions(view, group):
     if group == SCALARS:
         _numeric_distribution_pipelines(view, pipeline)
 
-    result = list(view.aggregate(pipeline))
+    result = view.aggregate(pipeline)
 
     if group in {LABELS, SCALARS}:
+        # `$facet` pipelines return a single document
         new_result = []
-        for f in result[0].values():
+        for f in next(result).values():
             new_result += f
         result = new_result
+    else:
+        result = list(result)
 
     if group != SCALARS:
         for idx, dist in enumerate(result):
@@ -285,7 +288,7 @@ def _numeric_bounds(view, numerics):
             }
         ]
 
-    return list(view.aggregate(bounds_pipeline))[0] if len(numerics) else {}
+    return next(view.aggregate(bounds_pipeline)) if len(numerics) else {}
 
 
 def _numeric_distribution_pipelines(view, pipeline, buckets=50):
@@ -12,24 +12,24 @@ TAGS = "tags"
 
 DISTRIBUTION_PIPELINES = {
     LABELS: [
+        # stages shared by all label types are applied once, before `$facet`
+        {"$project": {"field": {"$objectToArray": "$$ROOT"}}},
+        {"$unwind": "$field"},
+        {
+            "$match": {
+                "field.v._cls": {"$in": ["Classification", "Detections"]}
+            }
+        },
         {
             "$facet": {
                 "detections": [
-                    {"$project": {"field": {"$objectToArray": "$$ROOT"}}},
-                    {"$unwind": "$field"},
                     {"$match": {"field.v._cls": "Detections"}},
-                    {
-                        "$project": {
-                            "field": "$field.k",
-                            "detection": "$field.v.detections",
-                        }
-                    },
-                    {"$unwind": "$detection"},
+                    {"$unwind": "$field.v.detections"},
                     {
                         "$group": {
                             "_id": {
-                                "field": "$field",
-                                "label": "$detection.label",
+                                "field": "$field.k",
+                                "label": "$field.v.detections.label",
                             },
                             "count": {"$sum": 1},
                         }
@@ -54,18 +54,13 @@ DISTRIBUTION_PIPELINES = {
                     },
                 ],
                 "classifications": [
-                    {"$project": {"field": {"$objectToArray": "$$ROOT"}}},
-                    {"$unwind": "$field"},
                     {"$match": {"field.v._cls": "Classification"}},
-                    {
-                        "$project": {
-                            "field": "$field.k",
-                            "label": "$field.v.label",
-                        }
-                    },
                     {
                         "$group": {
-                            "_id": {"field": "$field", "label": "$label"},
+                            "_id": {
+                                "field": "$field.k",
+                                "label": "$field.v.label",
+                            },
                             "count": {"$sum": 1},
                         }
                     },
@@ -92,16 +87,12 @@ DISTRIBUTION_PIPELINES = {
         }
     ],
     TAGS: [
-        {"$project": {"tag": "$tags"}},
-        {"$unwind": "$tag"},
-        {"$group": {"_id": "$tag", "count": {"$sum": 1}}},
-        {"$project": {"result": "$$ROOT", "field": "tags"}},
+        {"$unwind": "$tags"},
+        {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
         {
             "$group": {
-                "_id": "$field",
-                "data": {
-                    "$push": {"key": "$result._id", "count": "$result.count"}
-                },
+                "_id": "tags",
+                "data": {"$push": {"key": "$_id", "count": "$count"}},
             }
         },
         {"$project": {"name": "$_id", "type": "tag", "data": "$data"}},
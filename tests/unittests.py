@@ -18,6 +18,7 @@ import math
 import os
 import unittest
 
+from bson import ObjectId
 from mongoengine.errors import (
     FieldDoesNotExist,
     ValidationError,
@@ -30,6 +31,7 @@ import fiftyone.core.dataset as fod
 import fiftyone.core.odm as foo
 from fiftyone.core.odm.sample import default_sample_fields
 import fiftyone.core.sample as fos
+import fiftyone.core.view as fov
 from fiftyone import ViewField as F
 
 
@@ -1181,6 +1183,150 @@ class DatasetViewTests(unittest.TestCase):
         for sample in view.match({"labels.label": "label1"}):
             self.assertEqual(sample.labels.label, "label1")
 
+    @drop_datasets
+    def test_aggregate_hint(self):
+        dataset = fo.Dataset()
+        sample1 = fo.Sample("1.jpg", tags=["train"])
+        sample2 = fo.Sample("2.jpg", tags=["test"])
+        dataset.add_samples([sample1, sample2])
+
+        view = dataset.view()
+        pipeline = [{"$match": {"_id": ObjectId(sample1.id)}}]
+        results = list(view.aggregate(pipeline, hint="_id_"))
+        self.assertEqual(len(results), 1)
+        self.assertEqual(str(results[0]["_id"]), sample1.id)
+
+        # hints are applied automatically to ID lookups
+        view = dataset.select([sample2.id])
+        self.assertListEqual([s.id for s in view], [sample2.id])
+
+    def test_default_hint(self):
+        hints = fov.DatasetView._DEFAULT_HINTS
+        _id = ObjectId()
+
+        pipeline = [{"$match": {"_id": _id}}]
+        self.assertEqual(fov._get_default_hint(pipeline, hints), "_id_")
+
+        pipeline = [{"$match": {"_id": {"$eq": _id}}}]
+        self.assertEqual(fov._get_default_hint(pipeline, hints), "_id_")
+
+        pipeline = [{"$match": {"_id": {"$in": [_id]}}}, {"$limit": 1}]
+        self.assertEqual(fov._get_default_hint(pipeline, hints), "_id_")
+
+        pipeline = [{"$match": {"_id": {"$not": {"$in": [_id]}}}}]
+        self.assertIsNone(fov._get_default_hint(pipeline, hints))
+
+        pipeline = [{"$match": {"$and": [{"_id": _id}, {"tags": "a"}]}}]
+        self.assertIsNone(fov._get_default_hint(pipeline, hints))
+
+        pipeline = [{"$match": {"_id": _id, "tags": "a"}}]
+        self.assertIsNone(fov._get_default_hint(pipeline, hints))
+
+        pipeline = [{"$sort": {"filepath": 1}}, {"$match": {"_id": _id}}]
+        self.assertIsNone(fov._get_default_hint(pipeline, hints))
+
+        self.assertIsNone(fov._get_default_hint([], hints))
+
+    @drop_datasets
+    def test_len(self):
+        dataset = fo.Dataset()
+        sample1 = fo.Sample("1.jpg", tags=["train"])
+        dataset.add_sample(sample1)
+
+        view = dataset.match_tag("train")
+        self.assertEqual(len(view), 1)
+
+        dataset.add_sample(fo.Sample("2.jpg", tags=["train"]))
+        self.assertEqual(len(view), 2)
+
+        sample1.tags = ["test"]
+        sample1.save()
+        self.assertEqual(len(view), 1)
+        self.assertEqual(len(view), len(list(view)))
+
+    @drop_datasets
+    def test_getitem(self):
+        dataset = fo.Dataset()
+        sample1 = fo.Sample("1.jpg", tags=["train"])
+        sample2 = fo.Sample("2.jpg", tags=["test"])
+        dataset.add_samples([sample1, sample2])
+
+        view = dataset.view()
+        sample_view = view[sample1.id]
+        self.assertIsInstance(sample_view, fos.SampleView)
+        self.assertEqual(sample_view.id, sample1.id)
+
+        view = dataset.match_tag("test")
+        self.assertEqual(view[sample2.id].id, sample2.id)
+        with self.assertRaises(KeyError):
+            view[sample1.id]
+
+        self.assertIn(sample2.id, view)
+        self.assertNotIn(sample1.id, view)
+        self.assertNotIn(5, view)
+        self.assertNotIn(None, view)
+        self.assertNotIn("not-an-id", view)
+
+    @drop_datasets
+    def test_get_tags(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample("1.jpg", tags=["tag1"]),
+                fo.Sample("2.jpg", tags=["tag1", "tag2"]),
+                fo.Sample("3.jpg", tags=["tag2", "tag3"]),
+                fo.Sample("4.jpg"),
+            ]
+        )
+
+        view = dataset.view()
+        self.assertSetEqual(set(view.get_tags()), {"tag1", "tag2", "tag3"})
+
+        view = dataset.match_tag("tag1")
+        self.assertSetEqual(set(view.get_tags()), {"tag1", "tag2"})
+
+        view = dataset.match_tag("missing")
+        self.assertListEqual(view.get_tags(), [])
+
+    @drop_datasets
+    def test_summary(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample("1.jpg", tags=["tag1"]),
+                fo.Sample("2.jpg", tags=["tag1", "tag2"]),
+                fo.Sample("3.jpg", tags=["tag3"]),
+            ]
+        )
+
+        view = dataset.match_tag("tag1")
+        summary = view.summary()
+        self.assertIn("Num samples:    2", summary)
+        self.assertIn("tag2", summary)
+        self.assertNotIn("tag3", summary)
+        self.assertEqual(len(view), 2)
+
+        view = dataset.match_tag("missing")
+        self.assertIn("Num samples:    0", view.summary())
+
+        # view with no stages, which uses the estimated count by default
+        view = dataset.view()
+        summary = view.summary()
+        self.assertIn("Num samples:    3", summary)
+        for tag in ("tag1", "tag2", "tag3"):
+            self.assertIn(tag, summary)
+
+        summary = view.summary(exact_count=True)
+        self.assertIn("Num samples:    3", summary)
+        for tag in ("tag1", "tag2", "tag3"):
+            self.assertIn(tag, summary)
+
+        # exact counts reflect changes to the dataset
+        view = dataset.match_tag("tag1")
+        self.assertIn("Num samples:    2", view.summary(exact_count=True))
+        dataset.add_sample(fo.Sample("4.jpg", tags=["tag1"]))
+        self.assertIn("Num samples:    3", view.summary(exact_count=True))
+
     @drop_datasets
     def test_sample_view_with_filtered_fields(self):
         dataset = fo.Dataset()
@@ -1906,6 +2052,15 @@ class ViewStageTests(unittest.TestCase):
         self.dataset.add_sample(self.sample1)
         self.dataset.add_sample(self.sample2)
 
+    def _get_pipeline(self, view):
+        return [s for stage in view.stages for s in stage.to_mongo()]
+
+    def _push_down_matches(self, view):
+        return fov._push_down_matches(self._get_pipeline(view))
+
+    def _fuse_stages(self, view):
+        return fov._fuse_stages(self._get_pipeline(view))
+
     def test_exclude(self):
         result = list(self.dataset.exclude([self.sample1.id]))
         self.assertIs(len(result), 1)
@@ -2024,6 +2179,138 @@ class ViewStageTests(unittest.TestCase):
         self.assertIs(len(result), 1)
         self.assertEqual(result[0].id, self.sample1.id)
 
+    def test_match_chained(self):
+        self.sample1["value"] = 1
+        self.sample1.tags.append("test")
+        self.sample1.save()
+        self.sample2["value"] = 1
+        self.sample2.save()
+        view = self.dataset.match({"value": 1}).match_tag("test")
+        result = list(view)
+        self.assertIs(len(result), 1)
+        self.assertEqual(result[0].id, self.sample1.id)
+
+    def test_match_after_sort_by(self):
+        self.sample1.tags.append("test")
+        self.sample1.save()
+        self.sample2.tags.append("test")
+        self.sample2.save()
+        result = list(
+            self.dataset.sort_by("filepath", reverse=True).match_tag("test")
+        )
+        self.assertIs(len(result), 2)
+        self.assertEqual(result[0].id, self.sample2.id)
+
+        view = self.dataset.sort_by("filepath").skip(1).match_tag("test")
+        result = list(view)
+        self.assertIs(len(result), 1)
+        self.assertEqual(result[0].id, self.sample2.id)
+
+    def test_match_after_sort_by_expr(self):
+        self.sample1["value"] = 1
+        self.sample1.save()
+        self.sample2["value"] = 2
+        self.sample2.save()
+
+        view = self.dataset.sort_by(F("value") * -1).match(
+            {"value": {"$gt": 0}}
+        )
+        self.assertIn("$match", self._push_down_matches(view)[0])
+        result = list(view)
+        self.assertIs(len(result), 2)
+        self.assertEqual(result[0].id, self.sample2.id)
+        self.assertEqual(result[1].id, self.sample1.id)
+
+        # The match references the temporary sort field, so it must not be
+        # moved past the stages that create and remove it
+        view = self.dataset.sort_by(F("value") * -1).match(
+            {"_sort_field": -1}
+        )
+        self.assertIn("$addFields", self._push_down_matches(view)[0])
+
+    def test_match_after_filter_labels(self):
+        self.sample1["test_dets"] = fo.Detections(
+            detections=[
+                fo.Detection(
+                    label="friend",
+                    confidence=0.9,
+                    bounding_box=[0, 0, 0.5, 0.5],
+                ),
+                fo.Detection(
+                    label="stopper",
+                    confidence=0.1,
+                    bounding_box=[0, 0, 0.5, 0.5],
+                ),
+            ]
+        )
+        self.sample1["test_clfs"] = fo.Classifications(
+            classifications=[
+                fo.Classification(label="friend", confidence=0.9),
+                fo.Classification(label="stopper", confidence=0.1),
+            ]
+        )
+        self.sample1.save()
+
+        # The matches must see the filtered lists
+        view = self.dataset.filter_detections(
+            "test_dets", F("confidence") > 0.5
+        ).match({"test_dets.detections.label": "stopper"})
+        self.assertIn("$addFields", self._push_down_matches(view)[0])
+        self.assertIs(len(list(view)), 0)
+
+        view = self.dataset.filter_detections(
+            "test_dets", F("confidence") > 0.5
+        ).match({"test_dets.detections.label": "friend"})
+        result = list(view)
+        self.assertIs(len(result), 1)
+        self.assertEqual(result[0].id, self.sample1.id)
+        self.assertIs(len(result[0].test_dets.detections), 1)
+
+        view = self.dataset.filter_classifications(
+            "test_clfs", F("confidence") > 0.5
+        ).match({"test_clfs.classifications.label": "stopper"})
+        self.assertIn("$addFields", self._push_down_matches(view)[0])
+        self.assertIs(len(list(view)), 0)
+
+        view = self.dataset.filter_classifications(
+            "test_clfs", F("confidence") > 0.5
+        ).match({"test_clfs.classifications.label": "friend"})
+        result = list(view)
+        self.assertIs(len(result), 1)
+        self.assertEqual(result[0].id, self.sample1.id)
+        self.assertIs(len(result[0].test_clfs.classifications), 1)
+
+    def test_match_after_select_exclude_fields(self):
+        self.sample1["value"] = 1
+        self.sample1.save()
+
+        view = self.dataset.select_fields().match({"value": 1})
+        self.assertIn("$project", self._push_down_matches(view)[0])
+        self.assertIs(len(list(view)), 0)
+
+        view = self.dataset.exclude_fields("value").match({"value": 1})
+        self.assertIn("$unset", self._push_down_matches(view)[0])
+        self.assertIs(len(list(view)), 0)
+
+        view = self.dataset.select_fields("value").match({"value": 1})
+        self.assertIn("$match", self._push_down_matches(view)[0])
+        result = list(view)
+        self.assertIs(len(result), 1)
+        self.assertEqual(result[0].id, self.sample1.id)
+
+    def test_expr_match_after_shuffle(self):
+        self.sample1["value"] = 1
+        self.sample1.save()
+
+        # The fields referenced by `$expr` matches are unknown, so the match
+        # must stay after the stages that add and remove the shuffle field
+        view = self.dataset.shuffle(seed=51).match(F("value") == 1)
+        pipeline = self._push_down_matches(view)
+        self.assertIn("$expr", pipeline[-1]["$match"])
+        result = list(view)
+        self.assertIs(len(result), 1)
+        self.assertEqual(result[0].id, self.sample1.id)
+
     def test_match_tag(self):
         self.sample1.tags.append("test")
         self.sample1.save()
@@ -2081,6 +2368,33 @@ class ViewStageTests(unittest.TestCase):
         self.assertIs(len(result), 1)
         self.assertEqual(result[0].id, self.sample2.id)
 
+    def test_skip_limit_fused(self):
+        self.dataset.add_samples(
+            [fo.Sample(filepath="test_%d.png" % i) for i in range(3, 7)]
+        )
+        view = self.dataset.sort_by("filepath")
+        sample_ids = [s.id for s in view]
+
+        view1 = view.skip(1).skip(1)
+        self.assertListEqual(
+            self._fuse_stages(view1), self._get_pipeline(view.skip(2))
+        )
+        self.assertListEqual([s.id for s in view1], sample_ids[2:])
+
+        view2 = view.limit(3).limit(1)
+        self.assertListEqual(
+            self._fuse_stages(view2), self._get_pipeline(view.limit(1))
+        )
+        self.assertListEqual([s.id for s in view2], sample_ids[:1])
+
+        # A skip between limits changes which samples are kept, so these
+        # stages must not be fused
+        view3 = view.limit(5).skip(2).limit(3)
+        self.assertListEqual(
+            self._fuse_stages(view3), self._get_pipeline(view3)
+        )
+        self.assertListEqual([s.id for s in view3], sample_ids[2:5])
+
     def test_sort_by(self):
         result = list(self.dataset.sort_by("filepath"))
         self.assertIs(len(result), 2)